@@ -49,7 +49,7 @@ from sardana.pool.poolobject import PoolObject
 from sardana.pool.poolcontainer import PoolContainer
 from sardana.pool.poolcontroller import PoolController
 from sardana.pool.poolmonitor import PoolMonitor
-from sardana.pool.poolmetacontroller import TYPE_MAP_OBJ
+from sardana.pool.poolmetacontroller import TYPE_MAP_OBJ, format_auto_name
 from sardana.pool.poolcontrollermanager import ControllerManager
 from sardana.pool.poolmeasurementgroup import PoolMeasurementGroup
 
@@ -380,9 +380,10 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
 
         td = TYPE_MAP_OBJ[ElementType.Controller]
         klass_map = td.klass
-        auto_full_name = td.auto_full_name
+        auto_name_parts = td.auto_full_name_parts
         kwargs['full_name'] = full_name = \
-            kwargs.get("full_name", auto_full_name.format(**kwargs))
+            kwargs.get("full_name",
+                       format_auto_name(auto_name_parts, kwargs))
         self.check_element(name, full_name)
 
         ctrl_class_info = None
@@ -447,8 +448,9 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
 
         td = TYPE_MAP_OBJ[elem_type]
         klass = td.klass
-        auto_full_name = td.auto_full_name
-        full_name = kwargs.get("full_name", auto_full_name.format(**kwargs))
+        auto_name_parts = td.auto_full_name_parts
+        full_name = kwargs.get("full_name",
+                               format_auto_name(auto_name_parts, kwargs))
 
         self.check_element(name, full_name)
 
@@ -482,8 +484,9 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
         kwargs["pool_name"] = self.name
         td = TYPE_MAP_OBJ[ElementType.MotorGroup]
         klass = td.klass
-        auto_full_name = td.auto_full_name
-        full_name = kwargs.get("full_name", auto_full_name.format(**kwargs))
+        auto_name_parts = td.auto_full_name_parts
+        full_name = kwargs.get("full_name",
+                               format_auto_name(auto_name_parts, kwargs))
         kwargs.pop('pool_name')
 
         self.check_element(name, full_name)
@@ -514,9 +517,10 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
 
         td = TYPE_MAP_OBJ[ElementType.MeasurementGroup]
         klass = td.klass
-        auto_full_name = td.auto_full_name
+        auto_name_parts = td.auto_full_name_parts
 
-        full_name = kwargs.get("full_name", auto_full_name.format(**kwargs))
+        full_name = kwargs.get("full_name",
+                               format_auto_name(auto_name_parts, kwargs))
         kwargs.pop('pool_name')
 
         self.check_element(name, full_name)
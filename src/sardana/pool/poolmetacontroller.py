@@ -27,13 +27,17 @@
 for"""
 
 __all__ = ["CONTROLLER_TEMPLATE", "CTRL_TYPE_MAP", "TYPE_MAP", "TYPE_MAP_OBJ",
-           "TypeData", "DTYPE_MAP", "DACCESS_MAP", "DataInfo",
-           "ControllerLibrary", "ControllerClass"]
+           "TypeData", "format_auto_name", "DTYPE_MAP", "DACCESS_MAP",
+           "DataInfo", "ControllerLibrary", "ControllerClass"]
 
 __docformat__ = 'restructuredtext'
 
+import ast
+import math
 import types
+import string
 import inspect
+import weakref
 
 from taurus.core.util.containers import CaselessDict
 
@@ -63,9 +67,10 @@ from sardana.pool.controller import Type, Access, Description, DefaultValue, \
     FGet, FSet, Memorize, Memorized, MaxDimSize
 
 
-#: String containing template code for a controller class
-CONTROLLER_TEMPLATE = """class @controller_name@(@controller_type@):
-    \"\"\"@controller_name@ description.\"\"\"
+#: String containing template code for a controller class. Fill it with
+#: ``CONTROLLER_TEMPLATE.format(controller_name=..., controller_type=...)``
+CONTROLLER_TEMPLATE = """class {controller_name}({controller_type}):
+    \"\"\"{controller_name} description.\"\"\"
 
 """
 
@@ -113,8 +118,48 @@ TYPE_MAP = {
 class TypeData(object):
     """Information for a specific Element type"""
 
-    def __init__(self, **kwargs):
-        self.__dict__.update(kwargs)
+    __slots__ = ('type', 'name', 'family', 'klass', 'auto_full_name',
+                 'auto_full_name_parts', 'ctrl_klass')
+
+    def __init__(self, type, name, family, klass, auto_full_name, ctrl_klass):
+        self.type = type
+        self.name = name
+        self.family = family
+        self.klass = klass
+        self.auto_full_name = auto_full_name
+        #: auto_full_name parsed with :meth:`string.Formatter.parse`
+        self.auto_full_name_parts = \
+            tuple(string.Formatter().parse(auto_full_name))
+        self.ctrl_klass = ctrl_klass
+
+
+#: format field conversions (``!s``, ``!r`` and ``!a``)
+_CONVERSIONS = {'s': str, 'r': repr, 'a': ascii}
+
+
+def format_auto_name(parts, ctx):
+    """Builds an element name from an automatic full name template already
+    parsed with :meth:`string.Formatter.parse` (see
+    :attr:`TypeData.auto_full_name_parts`). It is equivalent to
+    ``template.format(**ctx)`` for templates with plain field names.
+
+    :param parts: the parsed template
+    :type parts: seq<tuple<str, str, str, str>>
+    :param ctx: the values for the template fields
+    :type ctx: dict
+    :return: the element name
+    :rtype: :obj:`str`"""
+    name = []
+    for literal, field, spec, conversion in parts:
+        name.append(literal)
+        if field is None:
+            continue
+        value = ctx[field]
+        if conversion:
+            value = _CONVERSIONS[conversion](value)
+        name.append(format(value, spec))
+    return "".join(name)
+
 
 #: dictionary
 #: dict<:data:`~sardana.ElementType`, :class:`~sardana.pool.poolmetacontroller.TypeData`>
@@ -125,6 +170,32 @@ for t, d in list(TYPE_MAP.items()):
     TYPE_MAP_OBJ[t] = o
 
 
+def _build_type_tables():
+    """Builds the lookup tables used to find the element types of a
+    controller class:
+
+        - dict<controller class, tuple<:data:`~sardana.ElementType`>>
+          mapping each controller base class with the element types it
+          provides
+        - tuple<int> indexed by :data:`~sardana.ElementType` with the
+          position of each controllable element type in
+          :data:`TYPE_MAP_OBJ` (None for the rest)"""
+    ctrlklass_to_types = {}
+    type_rank = [None] * (max(TYPE_MAP_OBJ) + 1)
+    rank = 0
+    for t, o in list(TYPE_MAP_OBJ.items()):
+        if t not in TYPE_ELEMENTS:
+            continue
+        type_rank[t] = rank
+        rank += 1
+        ctrlklass_to_types[o.ctrl_klass] = \
+            ctrlklass_to_types.get(o.ctrl_klass, ()) + (t,)
+    return ctrlklass_to_types, tuple(type_rank)
+
+
+_CTRLKLASS_TO_TYPES, _TYPE_RANK = _build_type_tables()
+
+
 class ControllerLibrary(SardanaLibrary):
     """Object representing a python module containning controller classes.
     Public members:
@@ -160,7 +231,81 @@ class ControllerLibrary(SardanaLibrary):
         return self.meta_classes
 
 
+#: dictionaries dict<int, str> with the string representation of each
+#: :obj:`~sardana.DataType`, :obj:`~sardana.DataFormat` and
+#: :obj:`~sardana.DataAccess` value
+_DTYPE_WHATIS = {DataType[k]: k for k in DataType.keys()}
+_DFORMAT_WHATIS = {DataFormat[k]: k for k in DataFormat.keys()}
+_DACCESS_WHATIS = {DataAccess[k]: k for k in DataAccess.keys()}
+
+
+#: cache of the results of :func:`_decode_type_access`
+#: dict<tuple<type info, access info>, tuple<DataType, DataFormat, DataAccess>>
+_TYPE_ACCESS_CACHE = {}
+
+
+def _decode_type_access(dtype, daccess):
+    """Transforms the given type and access information (as given in the
+    controller properties/attributes definitions) into a tuple of three
+    elements (:obj:`~sardana.DataType`, :obj:`~sardana.DataFormat`,
+    :obj:`~sardana.DataAccess`). Results are cached since controllers use
+    a handful of different type/access definitions.
+
+    :param dtype: the data type information
+    :param daccess: the data access information
+    :return: a tuple <:obj:`~sardana.DataType`, :obj:`~sardana.DataFormat`,
+             :obj:`~sardana.DataAccess`>
+    :rtype: tuple"""
+    key = dtype, daccess
+    try:
+        return _TYPE_ACCESS_CACHE[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable type information (e.g. [[float]]): do not cache
+        return to_dtype_dformat(dtype) + (to_daccess(daccess),)
+    ret = _TYPE_ACCESS_CACHE[key] = \
+        to_dtype_dformat(dtype) + (to_daccess(daccess),)
+    return ret
+
+
+def _eval_literal(value):
+    """Evaluates the given string containing a python literal (number,
+    boolean, tuple, list, ...). Plain finite numbers are parsed directly, other
+    literals with :func:`ast.literal_eval`.
+
+    :param value: the string to be evaluated
+    :type value: :obj:`str`
+    :return: the python object represented by the string
+    :raises ValueError: if the string is not a python literal"""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+    except ValueError:
+        pass
+    else:
+        # "nan", "inf", ... are accepted by float but are not literals
+        if math.isfinite(number):
+            return number
+    try:
+        return ast.literal_eval(value.strip())
+    except (SyntaxError, TypeError) as e:
+        raise ValueError("malformed literal: {0!r}".format(value)) from e
+
+
 class DataInfo(object):
+    """Information about a controller property or attribute.
+
+    The dictionary representation returned by :meth:`toDict` and
+    :meth:`serialize` (for external clients) is built once, so the
+    attributes must not be changed once any of them has been called."""
+
+    __slots__ = ('name', 'dtype', 'dformat', 'access', 'description',
+                 'default_value', 'memorized', 'fget', 'fset', 'maxdimsize',
+                 '_dict_cache')
 
     def __init__(self, name, dtype, dformat=DataFormat.Scalar,
                  access=DataAccess.ReadWrite, description="",
@@ -183,6 +328,9 @@ class DataInfo(object):
             elif dformat == DataFormat.TwoD:
                 maxdimsize = 2048, 2048
         self.maxdimsize = maxdimsize
+        # the toDict result is built once: attributes must not be changed
+        # once toDict/serialize has been called (build a new DataInfo instead)
+        self._dict_cache = None
 
     def copy(self):
         s = self
@@ -194,36 +342,43 @@ class DataInfo(object):
 
     @classmethod
     def toDataInfo(klass, name, info):
-        info = CaselessDict(info)
-        dtype = info[Type]
-        dtype, dformat = to_dtype_dformat(dtype)
+        # the info keys are case insensitive (Type, Access, ... constants are
+        # lower case)
+        info = {k.lower(): v for k, v in info.items()}
+        dtype, dformat, daccess = _decode_type_access(
+            info[Type], info.get(Access, DataAccess.ReadWrite))
         default_value = info.get(DefaultValue)
         description = info.get(Description, '')
-        daccess = info.get(Access, DataAccess.ReadWrite)
-        daccess = to_daccess(daccess)
         memorized = info.get(Memorize, Memorized)
         maxdimsize = info.get(MaxDimSize)
         fget = info.get(FGet)
         fset = info.get(FSet)
         if default_value is not None and dtype != DataType.String:
             if isinstance(default_value, str):
-                default_value = eval(default_value)
+                default_value = _eval_literal(default_value)
         return DataInfo(name, dtype, dformat=dformat, access=daccess,
                         description=description, default_value=default_value,
                         memorized=memorized, fget=fget, fset=fset,
                         maxdimsize=maxdimsize)
 
+    def __toDict(self):
+        d = self._dict_cache
+        if d is None:
+            d = {'name': self.name, 'type': _DTYPE_WHATIS[self.dtype],
+                 'format': _DFORMAT_WHATIS[self.dformat],
+                 'access': _DACCESS_WHATIS[self.access],
+                 'description': self.description,
+                 'default_value': self.default_value,
+                 'memorized': self.memorized,
+                 'maxdimsize': self.maxdimsize}
+            self._dict_cache = d
+        return d
+
     def toDict(self):
-        return {'name': self.name, 'type': DataType.whatis(self.dtype),
-                'format': DataFormat.whatis(self.dformat),
-                'access': DataAccess.whatis(self.access),
-                'description': self.description,
-                'default_value': self.default_value,
-                'memorized': self.memorized,
-                'maxdimsize': self.maxdimsize}
+        return dict(self.__toDict())
 
     def serialize(self, *args, **kwargs):
-        kwargs.update(self.toDict())
+        kwargs.update(self.__toDict())
         return kwargs
 
     def __repr__(self):
@@ -246,6 +401,118 @@ class DataInfo(object):
 #        DataInfo.__init__(self, name, dtype, dformat, access=DataAcces.ReadWrite,
 #                          description=description, default_value=None)
 
+#: cache of the :class:`DataInfo` maps built for each controller class
+#: dict<class, tuple<CaselessDict, CaselessDict, CaselessDict, tuple<str>>>
+_DATAINFO_CACHE = weakref.WeakKeyDictionary()
+
+
+def _build_datainfo_maps(klass):
+    """Builds the controller properties, controller attributes and axis
+    attributes :class:`DataInfo` maps and the controller features of the given
+    controller class.
+
+    :param klass: the controller class
+    :type klass: class
+    :return: a tuple (properties, controller attributes, axis attributes,
+             features)
+    :rtype: tuple<CaselessDict, CaselessDict, CaselessDict, tuple<str>>"""
+    props = CaselessDict()
+    for k, v in list(klass.ctrl_properties.items()):
+        props[k] = DataInfo.toDataInfo(k, v)
+
+    ctrl_attrs = CaselessDict()
+    for k, v in list(klass.ctrl_attributes.items()):
+        ctrl_attrs[k] = DataInfo.toDataInfo(k, v)
+
+    axis_attrs = CaselessDict()
+    for k, v in list(klass.axis_attributes.items()):
+        axis_attrs[k] = DataInfo.toDataInfo(k, v)
+
+    features = tuple(klass.ctrl_features)
+    return props, ctrl_attrs, axis_attrs, features
+
+
+def _get_datainfo_maps(klass):
+    """Returns the (cached) result of :func:`_build_datainfo_maps` for the
+    given controller class. The cache entry is dropped together with the
+    class (e.g. when the controller library is reloaded)."""
+    try:
+        return _DATAINFO_CACHE[klass]
+    except KeyError:
+        maps = _DATAINFO_CACHE[klass] = _build_datainfo_maps(klass)
+        return maps
+
+
+#: constructor code flags required by the current controller API
+_API_INIT_FLAGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+
+def _build_api_version(klass):
+    # controllers whose constructor does not accept *args and **kwargs
+    # follow the old API (0)
+    flags = klass.__init__.__code__.co_flags
+    if flags & _API_INIT_FLAGS != _API_INIT_FLAGS:
+        return 0
+    return 1
+
+
+#: cache of other information derived from each controller class
+#: dict<class, dict<str, object>>
+_CLASS_INFO_CACHE = weakref.WeakKeyDictionary()
+
+
+def _get_class_info(klass, key, build):
+    """Returns the information identified by key for the given controller
+    class. On a cache miss the information is calculated with
+    ``build(klass)`` and stored until the class is discarded.
+
+    :param klass: the controller class
+    :type klass: class
+    :param key: the information identifier
+    :type key: :obj:`str`
+    :param build: callable that calculates the information from the class
+    :type build: callable
+    :return: the (cached) information"""
+    info = _CLASS_INFO_CACHE.get(klass)
+    if info is None:
+        info = _CLASS_INFO_CACHE[klass] = {}
+    try:
+        return info[key]
+    except KeyError:
+        value = info[key] = build(klass)
+        return value
+
+
+def _build_types(klass):
+    # element types (and their names) provided by the controller class
+    types = []
+    seen = set()
+    for base in klass.__mro__:
+        for _type in _CTRLKLASS_TO_TYPES.get(base, ()):
+            if _type not in seen:
+                seen.add(_type)
+                types.append(_type)
+    # keep the TYPE_MAP_OBJ order: the first type is the main type
+    types.sort(key=_TYPE_RANK.__getitem__)
+    return tuple(types), tuple(ElementType.whatis(t) for t in types)
+
+
+def _build_pseudo_motor_roles(klass):
+    motor_roles = tuple(klass.motor_roles)
+    pseudo_motor_roles = tuple(klass.pseudo_motor_roles)
+    if len(pseudo_motor_roles) == 0:
+        pseudo_motor_roles = (klass.__name__,)
+    return motor_roles, pseudo_motor_roles
+
+
+def _build_pseudo_counter_roles(klass):
+    counter_roles = tuple(klass.counter_roles)
+    pseudo_counter_roles = tuple(klass.pseudo_counter_roles)
+    if len(pseudo_counter_roles) == 0:
+        pseudo_counter_roles = (klass.__name__,)
+    return counter_roles, pseudo_counter_roles
+
+
 class ControllerClass(SardanaClass):
     """Object representing a python controller class.
        Public members:
@@ -262,87 +529,78 @@ class ControllerClass(SardanaClass):
 
         self.types = []
         self.dict_extra = {}
-        self.api_version = 1
+        self._serial_info = None
+        self._sort_key = None
         klass = self.klass
-        # Generic controller information
-        self.ctrl_features = tuple(klass.ctrl_features)
+        # Generic controller information. The DataInfo maps are built here
+        # (or taken from the per class cache) so that wrong definitions
+        # prevent the controller class from being registered
+        self.ctrl_properties, self.ctrl_attributes, self.axis_attributes, \
+            self.ctrl_features = _get_datainfo_maps(klass)
 
-        self.ctrl_properties = props = CaselessDict()
         self.ctrl_properties_descriptions = []
-        for k, v in list(klass.ctrl_properties.items()):
-            props[k] = DataInfo.toDataInfo(k, v)
+        for v in list(klass.ctrl_properties.values()):
             if Description in v:
                 self.ctrl_properties_descriptions.append(v[Description])
 
         self.dict_extra['properties'] = tuple(klass.ctrl_properties)
         self.dict_extra['properties_desc'] = self.ctrl_properties_descriptions
 
-        self.ctrl_attributes = ctrl_attrs = CaselessDict()
-        for k, v in list(klass.ctrl_attributes.items()):
-            ctrl_attrs[k] = DataInfo.toDataInfo(k, v)
-
-        self.axis_attributes = axis_attrs = CaselessDict()
-        for k, v in list(klass.axis_attributes.items()):
-            axis_attrs[k] = DataInfo.toDataInfo(k, v)
-
-        self.types = types = self.__build_types()
-        self.type_names = list(map(ElementType.whatis, types))
+        types, type_names = _get_class_info(klass, 'types', _build_types)
+        self.types = types = list(types)
+        self.type_names = list(type_names)
 
         if ElementType.PseudoMotor in types:
-            self.motor_roles = tuple(klass.motor_roles)
-            self.pseudo_motor_roles = tuple(klass.pseudo_motor_roles)
-            if len(self.pseudo_motor_roles) == 0:
-                self.pseudo_motor_roles = (klass.__name__,)
+            self.motor_roles, self.pseudo_motor_roles = _get_class_info(
+                klass, 'pseudo_motor_roles', _build_pseudo_motor_roles)
             self.dict_extra['motor_roles'] = self.motor_roles
             self.dict_extra['pseudo_motor_roles'] = self.pseudo_motor_roles
 
         if ElementType.PseudoCounter in types:
-            self.counter_roles = tuple(klass.counter_roles)
-            self.pseudo_counter_roles = tuple(klass.pseudo_counter_roles)
-            if len(self.pseudo_counter_roles) == 0:
-                self.pseudo_counter_roles = (klass.__name__,)
+            self.counter_roles, self.pseudo_counter_roles = _get_class_info(
+                klass, 'pseudo_counter_roles', _build_pseudo_counter_roles)
             self.dict_extra['counter_roles'] = self.counter_roles
             self.dict_extra['pseudo_counter_roles'] = self.pseudo_counter_roles
 
-        init_args = inspect.getargspec(klass.__init__)
-        if init_args.varargs is None or init_args.keywords is None:
-            self.api_version = 0
+        self.api_version = _get_class_info(klass, 'api_version',
+                                           _build_api_version)
 
     def __lt__(self, o):
-        main_type = self.types[0]
-        o_main_type = o.types[0]
-        if main_type != o_main_type:
-            return main_type < o_main_type
-        if self.gender != o.gender:
-            return self.gender < o.gender
-        return self.name < o.name
-
-    def __build_types(self):
-        types = []
-        klass = self.klass
-        for _type, type_data in list(TYPE_MAP_OBJ.items()):
-            if _type not in TYPE_ELEMENTS:
-                continue
-            if issubclass(klass, type_data.ctrl_klass):
-                types.append(_type)
-        return types
+        return self._get_sort_key() < o._get_sort_key()
+
+    def _get_sort_key(self):
+        # controller classes are sorted by main type, gender and name
+        key = self._sort_key
+        if key is None:
+            key = self._sort_key = self.types[0], self.gender, self.name
+        return key
 
     def serialize(self, *args, **kwargs):
         kwargs = SardanaClass.serialize(self, *args, **kwargs)
         kwargs['id'] = InvalidId
         kwargs['pool'] = self.get_manager().name
-        kwargs['gender'] = self.gender
-        kwargs['model'] = self.model
-        kwargs['organization'] = self.organization
-        kwargs['types'] = self.type_names
-        if len(self.type_names):
-            kwargs['main_type'] = self.type_names[0]
-        else:
-            kwargs['main_type'] = None
-        kwargs['api_version'] = self.api_version
-        kwargs.update(self.dict_extra)
+        kwargs.update(self.__get_serial_info())
         return kwargs
 
+    def __get_serial_info(self):
+        # the controller class information does not change during the
+        # lifetime of this object so it is only collected once
+        info = self._serial_info
+        if info is None:
+            info = {}
+            info['gender'] = self.gender
+            info['model'] = self.model
+            info['organization'] = self.organization
+            info['types'] = self.type_names
+            if len(self.type_names):
+                info['main_type'] = self.type_names[0]
+            else:
+                info['main_type'] = None
+            info['api_version'] = self.api_version
+            info.update(self.dict_extra)
+            self._serial_info = info
+        return info
+
     @property
     def controller_class(self):
         return self.klass
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import string
+import unittest
+
+from sardana import DataAccess, DataFormat, DataType, ElementType
+from sardana.pool.controller import TriggerGateController, ZeroDController
+from sardana.pool.poolmetacontroller import ControllerClass, DataInfo, \
+    TYPE_MAP_OBJ, format_auto_name
+from sardana.pool.poolexception import UnknownController
+from sardana.pool.test import FakePool
+
+
+class ZeroDTGController(ZeroDController, TriggerGateController):
+    """Controller providing both 0D experimental channels and trigger/gate
+    elements"""
+
+
+class FormatAutoNameTestCase(unittest.TestCase):
+    """Unittest of format_auto_name function"""
+
+    def test_format_auto_name(self):
+        """Verify that format_auto_name gives the same result as
+        str.format."""
+        ctx = dict(klass="DummyMotorController", name="motctrl01",
+                   ctrl_name="motctrl01", axis=1, pool_name="pool",
+                   full_name="instr")
+        for type_data in TYPE_MAP_OBJ.values():
+            self.assertEqual(
+                format_auto_name(type_data.auto_full_name_parts, ctx),
+                type_data.auto_full_name.format(**ctx))
+        parts = tuple(string.Formatter().parse("a{x!r}/{y:03d}b"))
+        self.assertEqual(format_auto_name(parts, dict(x="x", y=7)),
+                         "a'x'/007b")
+
+
+class DataInfoTestCase(unittest.TestCase):
+    """Unittest of DataInfo Class"""
+
+    def test_toDict(self):
+        """Verify the DataInfo dictionary representation."""
+        info = DataInfo.toDataInfo("Velocity", {'type': float,
+                                                'r/w type': 'read'})
+        d = info.toDict()
+        self.assertEqual(d['name'], "Velocity")
+        self.assertEqual(d['type'], "Double")
+        self.assertEqual(d['access'], "ReadOnly")
+        d['name'] = "Other"
+        self.assertEqual(info.toDict()['name'], "Velocity")
+        self.assertEqual(info.serialize()['name'], "Velocity")
+
+    def test_copy(self):
+        """Verify that copy returns an equivalent DataInfo."""
+        info = DataInfo.toDataInfo("Position", {'type': (float,),
+                                                'fget': "readPosition"})
+        other = info.copy()
+        self.assertIsNot(other, info)
+        self.assertEqual(other.toDict(), info.toDict())
+        self.assertEqual(other.fget, "readPosition")
+        self.assertEqual(other.fset, "setPosition")
+
+    def test_fget_fset(self):
+        """Verify the default and custom fget/fset method names."""
+        info = DataInfo("Gain", int)
+        self.assertEqual(info.fget, "getGain")
+        self.assertEqual(info.fset, "setGain")
+        info = DataInfo("Gain", int, fget="readGain", fset="writeGain")
+        self.assertEqual(info.fget, "readGain")
+        self.assertEqual(info.fset, "writeGain")
+
+    def test_toDataInfo_caseless(self):
+        """Verify that toDataInfo does not care about the info keys case."""
+        info = DataInfo.toDataInfo("Offset", {'Type': int,
+                                              'R/W Type': 'read',
+                                              'DefaultValue': 5,
+                                              'Description': "an offset"})
+        self.assertEqual(info.access, DataAccess.ReadOnly)
+        self.assertEqual(info.default_value, 5)
+        self.assertEqual(info.description, "an offset")
+
+    def test_toDataInfo_type(self):
+        """Verify the data type and format of the DataInfo."""
+        for dtype, expected in (
+                ('float', (DataType.Double, DataFormat.Scalar)),
+                ((int,), (DataType.Integer, DataFormat.OneD)),
+                ([[str]], (DataType.String, DataFormat.TwoD))):
+            for _ in range(2):
+                info = DataInfo.toDataInfo("Attr", {'type': dtype})
+                self.assertEqual((info.dtype, info.dformat), expected)
+
+    def test_toDataInfo_default_value(self):
+        """Verify that string default values of non string types are
+        evaluated."""
+        for dtype, value, expected in ((int, "3", 3),
+                                       (float, "1.5", 1.5),
+                                       (bool, "True", True),
+                                       ((float,), "[1.0, 2.0]", [1.0, 2.0]),
+                                       (str, "3", "3")):
+            info = DataInfo.toDataInfo("Attr", {'type': dtype,
+                                                'defaultvalue': value})
+            self.assertEqual(info.default_value, expected)
+        for value in ("__import__('os')", "2*3", "foo bar", "nan",
+                      "{[]: 1}"):
+            self.assertRaises(ValueError, DataInfo.toDataInfo, "Attr",
+                              {'type': int, 'defaultvalue': value})
+
+
+class ControllerClassTestCase(unittest.TestCase):
+    """Unittest of ControllerClass Class"""
+
+    def setUp(self):
+        """Get the DummyMotorController meta class from a FakePool"""
+        self.pool = FakePool()
+        self.ctrl_class = self.pool.ctrl_manager.getControllerMetaClass(
+            "DummyMotorController")
+
+    def test_datainfo_cache(self):
+        """Verify that the DataInfo maps are shared by the ControllerClass
+        objects of the same controller class."""
+        ctrl_class = self.ctrl_class
+        other = ControllerClass(pool=self.pool, lib=ctrl_class.lib,
+                                klass=ctrl_class.klass)
+        self.assertIs(other.ctrl_properties, ctrl_class.ctrl_properties)
+        self.assertIs(other.ctrl_attributes, ctrl_class.ctrl_attributes)
+        self.assertIs(other.axis_attributes, ctrl_class.axis_attributes)
+        self.assertEqual(other.ctrl_features, ctrl_class.ctrl_features)
+
+    def test_broken_definition(self):
+        """Verify that a controller class with a wrong property definition
+        is rejected and not registered in the controller manager."""
+        class BrokenController(ZeroDController):
+            ctrl_properties = {'P': {'Type': int,
+                                     'DefaultValue': 'numpy.pi'}}
+
+        self.assertRaises(ValueError, ControllerClass, pool=self.pool,
+                          lib=self.ctrl_class.lib, klass=BrokenController)
+        manager = self.pool.ctrl_manager
+        manager.addController(self.ctrl_class.lib, BrokenController)
+        self.assertRaises(UnknownController, manager.getControllerMetaClass,
+                          "BrokenController")
+        self.assertFalse(self.ctrl_class.lib.has_controller(
+            "BrokenController"))
+
+    def test_roles(self):
+        """Verify the pseudo motor roles."""
+        ctrl_class = self.pool.ctrl_manager.getControllerMetaClass("Slit")
+        other = ControllerClass(pool=self.pool, lib=ctrl_class.lib,
+                                klass=ctrl_class.klass)
+        for c in (ctrl_class, other):
+            self.assertEqual(c.motor_roles, ("sl2t", "sl2b"))
+            self.assertEqual(c.pseudo_motor_roles, ("Gap", "Offset"))
+            self.assertEqual(c.dict_extra['motor_roles'], ("sl2t", "sl2b"))
+
+    def test_api_version(self):
+        """Verify that controllers with an __init__ not accepting *args and
+        **kwargs are recognized as API version 0."""
+        class OldAPIController(ZeroDController):
+            def __init__(self, inst, props):
+                ZeroDController.__init__(self, inst, props)
+
+        ctrl_class = ControllerClass(pool=self.pool, lib=self.ctrl_class.lib,
+                                     klass=OldAPIController)
+        self.assertEqual(ctrl_class.api_version, 0)
+        self.assertEqual(self.ctrl_class.api_version, 1)
+
+    def test_serialize(self):
+        """Verify the serialized ControllerClass."""
+        self.pool.name = "pool"
+        for _ in range(2):
+            data = self.ctrl_class.serialize()
+            self.assertEqual(data['name'], "DummyMotorController")
+            self.assertEqual(data['pool'], "pool")
+            self.assertEqual(data['types'], ["Motor"])
+            self.assertEqual(data['main_type'], "Motor")
+            self.assertEqual(data['api_version'], 1)
+            self.assertIn('properties', data)
+
+    def test_sort(self):
+        """Verify that controller classes are sorted by main type, gender and
+        name."""
+        manager = self.pool.ctrl_manager
+        names = ["DummyMotorController", "DummyCounterTimerController",
+                 "BasicDummyMotorController", "Slit"]
+        ctrl_classes = sorted(manager.getControllerMetaClass(name)
+                              for name in names)
+        self.assertEqual([c.name for c in ctrl_classes],
+                         ["BasicDummyMotorController", "DummyMotorController",
+                          "DummyCounterTimerController", "Slit"])
+
+    def test_brief_description(self):
+        """Verify the brief description of a controller class."""
+        class DocController(ZeroDController):
+            """A controller
+            with a long description which does not fit in sixty characters"""
+
+        ctrl_class = ControllerClass(pool=self.pool, lib=self.ctrl_class.lib,
+                                     klass=DocController)
+        desc = DocController.__doc__.replace('\n', ' ')
+        self.assertEqual(ctrl_class.get_brief_description(),
+                         desc[:55] + '[...]')
+        self.assertEqual(ctrl_class.get_brief_description(max_chars=200),
+                         desc)
+
+    def test_types(self):
+        """Verify that the types of a controller implementing several
+        interfaces follow the TYPE_MAP_OBJ order."""
+        ctrl_class = ControllerClass(pool=self.pool, lib=self.ctrl_class.lib,
+                                     klass=ZeroDTGController)
+        self.assertEqual(ctrl_class.types, [ElementType.TriggerGate,
+                                            ElementType.ZeroDExpChannel])
+
+    def tearDown(self):
+        unittest.TestCase.tearDown(self)
+        self.ctrl_class = None
+        self.pool = None
@@ -497,9 +497,12 @@ class SardanaCode(SardanaBaseObject):
         return kwargs
 
     def get_brief_description(self, max_chars=60):
-        desc = self.description.replace('\n', ' ')
+        desc = self.description
+        # truncate before replacing so long docstrings are not fully scanned
         if len(desc) > (max_chars - 5):
-            desc = desc[:max_chars - 5] + '[...]'
+            desc = desc[:max_chars - 5].replace('\n', ' ') + '[...]'
+        else:
+            desc = desc.replace('\n', ' ')
         return desc
 
 
@@ -43,7 +43,7 @@ from taurus.core.util.log import Logger, DebugIt
 from sardana import State, SardanaServer, ElementType, Interface, \
     TYPE_ACQUIRABLE_ELEMENTS, TYPE_PSEUDO_ELEMENTS
 from sardana.pool.pool import Pool as POOL
-from sardana.pool.poolmetacontroller import TYPE_MAP_OBJ
+from sardana.pool.poolmetacontroller import TYPE_MAP_OBJ, format_auto_name
 from sardana.tango.core.util import get_tango_version_number
 import collections
 
@@ -312,10 +312,11 @@ class Pool(PyTango.LatestDeviceImpl, Logger):
         kwargs['module'] = mod_name
 
         td = TYPE_MAP_OBJ[ElementType.Controller]
-        auto_full_name = td.auto_full_name
+        auto_name_parts = td.auto_full_name_parts
         ctrl_class = td.ctrl_klass
 
-        full_name = kwargs.get("full_name", auto_full_name.format(**kwargs))
+        full_name = kwargs.get("full_name",
+                               format_auto_name(auto_name_parts, kwargs))
         util = PyTango.Util.instance()
 
         # check that element doesn't exist yet
@@ -513,9 +514,10 @@ class Pool(PyTango.LatestDeviceImpl, Logger):
         name = kwargs['name']
 
         td = TYPE_MAP_OBJ[elem_type]
-        auto_full_name = td.auto_full_name
+        auto_name_parts = td.auto_full_name_parts
 
-        full_name = kwargs.get("full_name", auto_full_name.format(**kwargs))
+        full_name = kwargs.get("full_name",
+                               format_auto_name(auto_name_parts, kwargs))
 
         ctrl = self.pool.get_element(name=ctrl_name)
 
@@ -648,9 +650,10 @@ class Pool(PyTango.LatestDeviceImpl, Logger):
         kwargs['pool_name'] = self.pool.name
 
         td = TYPE_MAP_OBJ[ElementType.MotorGroup]
-        auto_full_name = td.auto_full_name
+        auto_name_parts = td.auto_full_name_parts
 
-        full_name = kwargs.get("full_name", auto_full_name.format(**kwargs))
+        full_name = kwargs.get("full_name",
+                               format_auto_name(auto_name_parts, kwargs))
 
         self._check_element(name, full_name)
 
@@ -681,9 +684,10 @@ class Pool(PyTango.LatestDeviceImpl, Logger):
         kwargs['pool_name'] = self.pool.name
 
         td = TYPE_MAP_OBJ[ElementType.MeasurementGroup]
-        auto_full_name = td.auto_full_name
+        auto_name_parts = td.auto_full_name_parts
 
-        full_name = kwargs.get("full_name", auto_full_name.format(**kwargs))
+        full_name = kwargs.get("full_name",
+                               format_auto_name(auto_name_parts, kwargs))
 
         self._check_element(name, full_name)
 
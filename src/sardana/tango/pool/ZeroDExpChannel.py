@@ -41,6 +41,7 @@ from taurus.core.util.log import DebugIt
 from sardana import State, DataFormat, SardanaServer
 from sardana.sardanaattribute import SardanaAttribute
 from sardana.pool.controller import ZeroDController, Type
+from sardana.pool.poolmetacontroller import DataInfo
 from sardana.tango.core.util import to_tango_type_format
 
 from sardana.tango.pool.PoolDevice import PoolExpChannelDevice, \
@@ -151,8 +152,12 @@ class ZeroDExpChannel(PoolExpChannelDevice):
 
                 # Add manually a 'CurrentValue' with the same time as 'Value'
                 attr_name = 'CurrentValue'
-                attr_info = attr_info.copy()
-                attr_info.description = attr_name
+                i = attr_info
+                attr_info = DataInfo(i.name, i.dtype, dformat=i.dformat,
+                                     access=i.access, description=attr_name,
+                                     default_value=i.default_value,
+                                     memorized=i.memorized, fget=i.fget,
+                                     fset=i.fset, maxdimsize=i.maxdimsize)
                 std_attrs[attr_name] = [attr_name, data_info, attr_info]
 
         return std_attrs, dyn_attrs